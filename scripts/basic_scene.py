@@ -29,27 +29,22 @@ environment.set_hdri_lighting(hdri_path)
 
 # ---------- Add Render Settings ----------
 
-# Create render settings
+# Create RenderVars, RenderProducts and the RenderSettings prim referencing both products
 render_mgr = RenderSettingsManager(builder.stage)
-
-# Create RenderVars
-color_var = render_mgr.create_render_var("color", "Ci")
-depth_var = render_mgr.create_render_var("depth", "z", data_type="float", source_type="builtin")
-
-
-# Create RenderProducts
-color_product = render_mgr.create_render_product("ColorProduct", camera_path, "./outputs/renders/color.exr", [color_var])
-depth_product = render_mgr.create_render_product("DepthProduct", camera_path, "./outputs/renders/depth.exr", [depth_var])
-
-# Create RenderSettings prim referencing both products
-render_mgr.create_basic_render_settings("PrimarySettings", camera_path, resolution=(512, 512), products=[
-    color_product,
-    depth_product
-])
+render_mgr.configure(
+    "PrimarySettings",
+    camera_path,
+    resolution=(512, 512),
+    vars_spec=[
+        {"name": "color", "source_name": "Ci"},
+        {"name": "depth", "source_name": "z", "data_type": "float", "source_type": "builtin"},
+    ],
+    products_spec=[
+        ("ColorProduct", "./outputs/renders/color.exr", ["color"]),
+        ("DepthProduct", "./outputs/renders/depth.exr", ["depth"]),
+    ],
+)
 # -----------------------------------------
 
-# Save
-builder.save()
-
-# Print USDA
-builder.print_stage()
+# Save and print USDA
+builder.save_and_dump()
@@ -1,29 +1,443 @@
-from pxr import Usd, UsdGeom, UsdShade, Sdf, Gf, UsdLux, UsdRender
-import math
+from pxr import Usd, UsdGeom, Sdf, Gf, UsdLux, UsdRender, Vt
+import concurrent.futures
+import contextlib
+import functools
+import logging
+import os
 import pathlib
+import shutil
+import sys
+import tempfile
+import numpy as np
+
+_LOG = logging.getLogger(__name__)
+
+# Value type names, resolved once instead of on every attribute authored
+_VT_COLOR3F = Sdf.ValueTypeNames.Color3f
+_VT_DOUBLE = Sdf.ValueTypeNames.Double
+_VT_DOUBLE3 = Sdf.ValueTypeNames.Double3
+_VT_FLOAT = Sdf.ValueTypeNames.Float
+_VT_POINT3F_ARRAY = Sdf.ValueTypeNames.Point3fArray
+_VT_INT2 = Sdf.ValueTypeNames.Int2
+_VT_INT_ARRAY = Sdf.ValueTypeNames.IntArray
+_VT_STRING = Sdf.ValueTypeNames.String
+_VT_TOKEN = Sdf.ValueTypeNames.Token
+_VT_TOKEN_ARRAY = Sdf.ValueTypeNames.TokenArray
+
+# Tokens and shader identifiers used while authoring
+_TOK_Y = UsdGeom.Tokens.y
+_TOK_PERSP = UsdGeom.Tokens.perspective
+_PREVIEW_SURFACE = "UsdPreviewSurface"
+_SURFACE_OUTPUT = "outputs:surface"
+
+# Shared axis constants; never mutate these in place
+_X_AXIS = Gf.Vec3d(1.0, 0.0, 0.0)
+_Y_AXIS = Gf.Vec3d(0.0, 1.0, 0.0)
+
+# UsdPreviewSurface recipes: (input name, value type, default) per shader input
+_RECIPES = {
+    "car_paint": (
+        ("diffuseColor", _VT_COLOR3F, (0.1, 0.2, 0.8)),
+        ("metallic", _VT_FLOAT, 1.0),
+        ("roughness", _VT_FLOAT, 0.2),
+        ("clearcoat", _VT_FLOAT, 0.5),
+        ("clearcoatRoughness", _VT_FLOAT, 0.1),
+    ),
+    "glass": (
+        ("diffuseColor", _VT_COLOR3F, (0.9, 0.9, 0.9)),
+        ("opacity", _VT_FLOAT, 0.2),
+        ("ior", _VT_FLOAT, 1.5),
+        ("roughness", _VT_FLOAT, 0.01),
+    ),
+    "plastic": (
+        ("diffuseColor", _VT_COLOR3F, (0.8, 0.2, 0.2)),
+        ("metallic", _VT_FLOAT, 0.0),
+        ("roughness", _VT_FLOAT, 0.3),
+        ("specular", _VT_FLOAT, 0.5),
+    ),
+    "wood": (
+        ("diffuseColor", _VT_COLOR3F, (0.4, 0.2, 0.1)),
+        ("metallic", _VT_FLOAT, 0.0),
+        ("roughness", _VT_FLOAT, 0.7),
+        ("specular", _VT_FLOAT, 0.5),
+    ),
+}
+
+# Derived once at import: (attribute name, value type) schema and (input name, default) pairs.
+# Recipes with the same inputs (plastic, wood) end up with equal schemas and share templates.
+_RECIPE_SCHEMAS = {
+    kind: tuple((f"inputs:{input_name}", value_type) for input_name, value_type, _ in recipe)
+    for kind, recipe in _RECIPES.items()
+}
+_RECIPE_DEFAULTS = {
+    kind: tuple((input_name, default) for input_name, _, default in recipe)
+    for kind, recipe in _RECIPES.items()
+}
+
+# Extensions Sdf can write a stage to
+_USD_EXTENSIONS = (".usd", ".usda", ".usdc", ".usdz")
+
+# Pre-built material networks keyed by input schema, copied into stages by MaterialLibrary
+_MATERIAL_TEMPLATES = {}
+_TEMPLATE_PATH = Sdf.Path("/Material")
+
+_DOME_LIGHT_PATH = Sdf.Path("/Environment/Light")
+
+
+@functools.lru_cache(maxsize=4096)
+def _p(path):
+    """
+    Parse a prim or property path once and reuse the interned Sdf.Path afterwards.
+
+    Args:
+        path (str or Sdf.Path): Path to convert
+
+    Returns:
+        Sdf.Path: The path
+    """
+    return Sdf.Path(path)
+
+
+def _get_or_define(schema, stage, path):
+    """
+    Return the prim at path if it already has the schema's type, defining it otherwise.
+
+    Rebuilding a scene in place then skips Define's spec and type checks for prims that
+    are already there.
+
+    Args:
+        schema (type): Typed schema class (e.g. UsdGeom.Camera)
+        stage (Usd.Stage): Stage to look in
+        path (str or Sdf.Path): Prim path
+
+    Returns:
+        The prim wrapped in schema
+    """
+    prim = stage.GetPrimAtPath(path)
+    if prim and prim.IsA(schema):
+        return schema(prim)
+    return schema.Define(stage, path)
+
+
+def _define_prim_spec(layer, path, type_name=""):
+    """
+    Get or create a defined prim spec directly in a layer.
+
+    Missing ancestors are authored as typeless defs, matching Usd.Stage.DefinePrim.
+
+    Args:
+        layer (Sdf.Layer): Layer to author into
+        path (str or Sdf.Path): Absolute prim path
+        type_name (str): Schema type name (e.g. "Material"). Empty keeps the existing type.
+
+    Returns:
+        Sdf.PrimSpec: Prim spec at the given path (the layer's pseudo-root for "/")
+    """
+    path = _p(path)
+    if path == Sdf.Path.absoluteRootPath:
+        return layer.pseudoRoot
+
+    parent_path = path.GetParentPath()
+    if parent_path == Sdf.Path.absoluteRootPath:
+        parent = layer.pseudoRoot
+    else:
+        parent = _define_prim_spec(layer, parent_path)
+    return _define_child_spec(parent, path.name, type_name)
+
+
+def _define_child_spec(parent_spec, name, type_name=""):
+    """
+    Get or create a defined prim spec under an already known parent spec.
+
+    Args:
+        parent_spec (Sdf.PrimSpec): Parent prim spec (or a layer's pseudo-root)
+        name (str): Child prim name
+        type_name (str): Schema type name. Empty keeps the existing type.
+
+    Returns:
+        Sdf.PrimSpec: The child prim spec
+    """
+    spec = parent_spec.nameChildren.get(name)
+    if spec is None:
+        return Sdf.PrimSpec(parent_spec, name, Sdf.SpecifierDef, type_name)
+
+    spec.specifier = Sdf.SpecifierDef
+    if type_name:
+        spec.typeName = type_name
+    return spec
+
+
+def _set_attr_spec(prim_spec, name, value_type, value=None, variability=Sdf.VariabilityVarying):
+    """
+    Get or create an attribute spec and optionally set its default value.
+
+    Args:
+        prim_spec (Sdf.PrimSpec): Prim spec owning the attribute
+        name (str): Attribute name (e.g. "inputs:roughness")
+        value_type (Sdf.ValueTypeName): Attribute value type
+        value (optional): Default value to author. If None, only the attribute is declared.
+        variability (Sdf.Variability): Varying or uniform
+
+    Returns:
+        Sdf.AttributeSpec: The attribute spec
+    """
+    attr = prim_spec.attributes.get(name)
+    if attr is None:
+        attr = Sdf.AttributeSpec(prim_spec, name, value_type, variability)
+    if value is not None:
+        attr.default = value
+    return attr
+
+
+def _set_rel_spec(prim_spec, name, targets):
+    """
+    Get or create a relationship spec and set its explicit targets.
+
+    Args:
+        prim_spec (Sdf.PrimSpec): Prim spec owning the relationship
+        name (str): Relationship name (e.g. "camera")
+        targets (list): Target paths (str or Sdf.Path)
+
+    Returns:
+        Sdf.RelationshipSpec: The relationship spec
+    """
+    rel = prim_spec.relationships.get(name)
+    if rel is None:
+        rel = Sdf.RelationshipSpec(prim_spec, name, False)
+    rel.targetPathList.explicitItems = [_p(target) for target in targets]
+    return rel
+
+
+def _as_vec3d(value):
+    """
+    Convert a 3-vector to Gf.Vec3d, passing Gf.Vec3d values through without a copy.
+
+    Args:
+        value (Gf.Vec3d, tuple or np.ndarray): (x, y, z) vector
+
+    Returns:
+        Gf.Vec3d: The vector
+    """
+    if isinstance(value, Gf.Vec3d):
+        return value
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    return Gf.Vec3d(*value)
+
+
+def _mesh_arrays(points, indices, counts):
+    """
+    Convert mesh topology to Vt arrays, copying each NumPy buffer in one go.
+
+    Args:
+        points (array-like): (N, 3) vertex positions
+        indices (array-like): Face vertex indices
+        counts (array-like): Vertex count per face
+
+    Returns:
+        tuple: (Vt.Vec3fArray, Vt.IntArray, Vt.IntArray) for points, indices and counts
+    """
+    points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+    indices = np.ascontiguousarray(indices, dtype=np.int32).ravel()
+    counts = np.ascontiguousarray(counts, dtype=np.int32).ravel()
+    assert counts.sum() == len(indices), "face vertex counts must cover every index"
+
+    return Vt.Vec3fArray.FromBuffer(points), Vt.IntArray.FromBuffer(indices), Vt.IntArray.FromBuffer(counts)
+
+
+def _round_input(value, digits=6):
+    """
+    Round a shader input value (scalar or tuple) for use in a cache key.
+
+    Args:
+        value (float or tuple): Input value
+        digits (int): Decimal places to keep
+
+    Returns:
+        float or tuple: Rounded value
+    """
+    if isinstance(value, tuple):
+        return tuple(round(component, digits) for component in value)
+    return round(value, digits)
+
+
+def _set_translate_spec(prim_spec, position):
+    """
+    Author a translate-only xform op stack on a prim spec.
+
+    Args:
+        prim_spec (Sdf.PrimSpec): Prim spec to transform
+        position (Gf.Vec3d, tuple or np.ndarray): (x, y, z) translation
+    """
+    _set_attr_spec(prim_spec, "xformOp:translate", _VT_DOUBLE3, _as_vec3d(position))
+    _set_attr_spec(prim_spec, "xformOpOrder", _VT_TOKEN_ARRAY,
+                   Vt.TokenArray(["xformOp:translate"]), Sdf.VariabilityUniform)
+
+
+def _bind_material_spec(prim_spec, material_path):
+    """
+    Bind a material to a prim spec, as UsdShade.MaterialBindingAPI.Bind would.
+
+    Args:
+        prim_spec (Sdf.PrimSpec): Prim spec to bind the material to
+        material_path (str or Sdf.Path): Path to the material
+    """
+    api_schemas = prim_spec.GetInfo("apiSchemas")
+    if "MaterialBindingAPI" not in api_schemas.GetAddedOrExplicitItems():
+        if api_schemas.isExplicit:
+            api_schemas.explicitItems = list(api_schemas.explicitItems) + ["MaterialBindingAPI"]
+        else:
+            api_schemas.prependedItems = list(api_schemas.prependedItems) + ["MaterialBindingAPI"]
+        prim_spec.SetInfo("apiSchemas", api_schemas)
+
+    _set_rel_spec(prim_spec, "material:binding", [material_path])
+
+
+def _material_template(schema):
+    """
+    Get the template layer holding a UsdPreviewSurface network for an input schema.
+
+    The template is built once, in an anonymous layer, with every shader input declared
+    and the surface output connected; callers copy it and only fill in input values.
+
+    Args:
+        schema (tuple): (attribute name, Sdf.ValueTypeName) for each shader input
+
+    Returns:
+        Sdf.Layer: Layer with the material at _TEMPLATE_PATH
+    """
+    layer = _MATERIAL_TEMPLATES.get(schema)
+    if layer is not None:
+        return layer
+
+    layer = Sdf.Layer.CreateAnonymous("material_template")
+    material_spec = _define_prim_spec(layer, _TEMPLATE_PATH, "Material")
+    shader_spec = _define_child_spec(material_spec, "Shader", "Shader")
+    _set_attr_spec(shader_spec, "info:id", _VT_TOKEN, _PREVIEW_SURFACE, Sdf.VariabilityUniform)
+    for attr_name, value_type in schema:
+        _set_attr_spec(shader_spec, attr_name, value_type)
+
+    shader_output = _set_attr_spec(shader_spec, _SURFACE_OUTPUT, _VT_TOKEN)
+    surface_output = _set_attr_spec(material_spec, _SURFACE_OUTPUT, _VT_TOKEN)
+    surface_output.connectionPathList.explicitItems = [shader_output.path]
+
+    return _MATERIAL_TEMPLATES.setdefault(schema, layer)
 
 
 class SceneBuilder:
     """Main class for building USD scenes, handling geometry, cameras, and environment lighting"""
 
+    # Quad plane mesh arrays keyed by size, shared by every builder
+    _plane_geometry = {}
+
     def __init__(self, stage_path=None):
         """
         Initialize a new USD stage
 
         Args:
             stage_path (str, optional): Path to save USD file. If None, creates in-memory stage.
+                The extension picks the format; ".usd" and ".usdc" author a binary crate file.
         """
         # Create new stage (either on disk or in memory)
-        if stage_path:
+        if stage_path and pathlib.Path(stage_path).suffix == ".usd":
+            # Pin ".usd" files to binary crate instead of USD_DEFAULT_FILE_FORMAT
+            self.stage = Usd.Stage.Open(Sdf.Layer.CreateNew(stage_path, args={"format": "usdc"}))
+        elif stage_path:
             self.stage = Usd.Stage.CreateNew(stage_path)
         else:
             self.stage = Usd.Stage.CreateInMemory()
-        UsdGeom.SetStageUpAxis(self.stage, UsdGeom.Tokens.y)
-        UsdGeom.SetStageMetersPerUnit(self.stage, 0.01)
+        self._init_scene()
+
+    @classmethod
+    def from_reusable_layer(cls, layer):
+        """
+        Start a new scene in a caller-owned layer, reusing it instead of allocating a new one
+
+        The layer is cleared first, so one anonymous layer can back many scenes built and
+        exported one after another. Save with an explicit path, since anonymous layers
+        can't be saved in place.
+
+        Args:
+            layer (Sdf.Layer): Layer to clear and build into (e.g. Sdf.Layer.CreateAnonymous())
+
+        Returns:
+            SceneBuilder: Builder whose stage's root layer is the given layer
+        """
+        layer.Clear()
+        builder = cls.__new__(cls)
+        builder.stage = Usd.Stage.Open(layer)
+        builder._init_scene()
+        return builder
+
+    def _init_scene(self):
+        """
+        Internal method to author the scene root and set up per-builder state on self.stage.
+        """
+        # Author /World and the layer metadata as scene description under one change notification
+        root_layer = self.stage.GetRootLayer()
+        with Sdf.ChangeBlock():
+            _define_prim_spec(root_layer, "/World", "Xform")
+            root_layer.defaultPrim = "World"
+            UsdGeom.SetStageUpAxis(self.stage, _TOK_Y)
+            UsdGeom.SetStageMetersPerUnit(self.stage, 0.01)
+        self.world = UsdGeom.Xform(self.stage.GetPrimAtPath("/World"))
+
+        # Nesting depth of batch() blocks
+        self._batch_depth = 0
+
+        # Background writer used by save_async
+        self._save_executor = None
+        self._pending_saves = []
+
+    def reference_materials(self, sublayer_path):
+        """
+        Compose a material library saved with MaterialLibrary.save_as_sublayer into the scene
 
-        # Create and set default prim at /World
-        self.world = UsdGeom.Xform.Define(self.stage, "/World")
-        self.stage.SetDefaultPrim(self.world.GetPrim())
+        The file is added as a sublayer of the root layer, so its /Materials prims can be
+        bound by path like locally created ones. Adding the same file twice is a no-op.
+
+        Args:
+            sublayer_path (str): Path to the material layer, resolved relative to the
+                root layer like any sublayer path
+        """
+        sublayer_paths = self.stage.GetRootLayer().subLayerPaths
+        if sublayer_path not in sublayer_paths:
+            sublayer_paths.append(sublayer_path)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Coalesce everything authored inside the block into one change notification
+
+        Use it around loops of add_* calls. The stage only recomposes when the block
+        exits, so add_* methods return None inside a batch; look prims up with
+        self.stage.GetPrimAtPath() afterwards. MaterialLibrary can author inside a batch
+        too, but Camera and Environment define prims through the stage and can't.
+
+        Yields:
+            SceneBuilder: This builder
+        """
+        self._batch_depth += 1
+        try:
+            with Sdf.ChangeBlock():
+                yield self
+        finally:
+            self._batch_depth -= 1
+
+    def _wrap(self, schema, path):
+        """
+        Internal method to wrap a freshly authored prim in its schema class.
+
+        Args:
+            schema (type): UsdGeom schema class
+            path (str or Sdf.Path): Prim path
+
+        Returns:
+            The schema object, or None inside batch() where the prim isn't composed yet
+        """
+        if self._batch_depth:
+            return None
+        return schema(self.stage.GetPrimAtPath(path))
 
     def add_sphere(self, path, radius=1.0, material=None):
         """
@@ -35,13 +449,9 @@ class SceneBuilder:
             material (str, optional): Path to material to assign
 
         Returns:
-            UsdGeom.Sphere: Created sphere prim.
+            UsdGeom.Sphere: Created sphere prim (None inside batch()).
         """
-        sphere = UsdGeom.Sphere.Define(self.stage, path)
-        sphere.CreateRadiusAttr().Set(radius)
-        if material:
-            self._assign_material(sphere, material)
-        return sphere
+        return self._add_gprims(UsdGeom.Sphere, "Sphere", "radius", [(path, radius, material)])[0]
 
     def add_cube(self, path, size=1.0, material=None):
         """
@@ -53,13 +463,9 @@ class SceneBuilder:
             material (str, optional): Path to material to assign
 
         Returns:
-            UsdGeom.Sphere: Created cube prim.
+            UsdGeom.Cube: Created cube prim (None inside batch()).
         """
-        cube = UsdGeom.Cube.Define(self.stage, path)
-        cube.CreateSizeAttr().Set(size)
-        if material:
-            self._assign_material(cube, material)
-        return cube
+        return self._add_gprims(UsdGeom.Cube, "Cube", "size", [(path, size, material)])[0]
 
     def add_plane(self, path, size=10.0, material=None):
         """
@@ -67,107 +473,471 @@ class SceneBuilder:
 
         Args:
             path (str): USD path for the new plane
-            size (float): Length of each side
+            size (float): Half the length of each side
             material (str, optional): Path to material to assign
 
         Returns:
-            UsdGeom.mesh: Created plane mesh
+            UsdGeom.Mesh: Created plane mesh (None inside batch()).
+        """
+        geometry = self._plane_geometry.get(size)
+        if geometry is None:
+            # Define vertices for a quad mesh
+            points = np.array([
+                (-size, 0, -size),
+                (size, 0, -size),
+                (size, 0, size),
+                (-size, 0, size),
+            ], dtype=np.float32)
+
+            # Triangle indices (2 triangles forming a quad)
+            indices = np.array([0, 1, 2, 0, 2, 3], dtype=np.int32)
+            counts = np.full(len(indices) // 3, 3, dtype=np.int32)
+
+            geometry = _mesh_arrays(points, indices, counts)
+            self._plane_geometry[size] = geometry
+        return self._add_mesh(path, geometry, material)
+
+    def add_subdivided_plane(self, path, size=10.0, subdivisions=8, material=None):
         """
-        # Define vertices for a quad mesh
-        points = [
-            (-size, 0, -size),
-            (size, 0, -size),
-            (size, 0, size),
-            (-size, 0, size),
-        ]
+        Add a plane split into a grid of triangulated cells, e.g. for displaced ground
 
-        # Triangle indices (2 triangles forming a quad)
-        indices = [0, 1, 2, 0, 2, 3]
+        Args:
+            path (str): USD path for the new plane
+            size (float): Half the length of each side, as for add_plane
+            subdivisions (int): Number of cells along each side
+            material (str, optional): Path to material to assign
 
-        plane = UsdGeom.Mesh.Define(self.stage, path)
-        plane.GetPointsAttr().Set(points)
-        plane.GetFaceVertexIndicesAttr().Set(indices)
-        plane.GetFaceVertexCountsAttr().Set([3] * len(indices))
+        Returns:
+            UsdGeom.Mesh: Created plane mesh (None inside batch()).
+        """
+        if subdivisions < 1:
+            raise ValueError(f"subdivisions must be at least 1, got {subdivisions}")
 
+        # (n + 1)^2 vertices, row-major with X varying fastest
+        row = subdivisions + 1
+        xs, zs = np.meshgrid(np.linspace(-size, size, row), np.linspace(-size, size, row))
+        points = np.stack([xs.ravel(), np.zeros(xs.size), zs.ravel()], axis=1)
+
+        # Two triangles per cell, wound like add_plane's quad
+        cells = np.arange(subdivisions)
+        corner = (cells[:, None] * row + cells[None, :]).ravel()
+        indices = np.stack([corner, corner + 1, corner + row + 1,
+                            corner, corner + row + 1, corner + row], axis=1)
+        counts = np.full(2 * subdivisions * subdivisions, 3)
+
+        return self._add_mesh(path, _mesh_arrays(points, indices, counts), material)
+
+    def _add_mesh(self, path, geometry, material=None):
+        """
+        Internal method to author a mesh prim spec from prebuilt Vt arrays.
+
+        Args:
+            path (str): USD path for the new mesh
+            geometry (tuple): (points, face vertex indices, face vertex counts) Vt arrays
+            material (str, optional): Path to material to assign
+
+        Returns:
+            UsdGeom.Mesh: Created mesh (None inside batch()).
+        """
+        points, indices, counts = geometry
+
+        layer = self.stage.GetEditTarget().GetLayer()
+        with Sdf.ChangeBlock():
+            mesh_spec = _define_prim_spec(layer, path, "Mesh")
+            _set_attr_spec(mesh_spec, "points", _VT_POINT3F_ARRAY, points)
+            _set_attr_spec(mesh_spec, "faceVertexIndices", _VT_INT_ARRAY, indices)
+            _set_attr_spec(mesh_spec, "faceVertexCounts", _VT_INT_ARRAY, counts)
+
+            if material:
+                _bind_material_spec(mesh_spec, material)
+        return self._wrap(UsdGeom.Mesh, path)
+
+    def add_spheres_bulk(self, paths, positions, radius=1.0, material=None):
+        """
+        Add many spheres sharing a radius and material, each at its own position
+
+        One template sphere is authored in a scratch layer and stamped out per path with
+        Sdf.CopySpec, so only the translation is written per instance.
+
+        Args:
+            paths (list): USD paths for the new spheres
+            positions (list or np.ndarray): (x, y, z) position per sphere, shape (N, 3)
+            radius (float): Sphere radius
+            material (str, optional): Path to material to assign
+
+        Returns:
+            list: Created UsdGeom.Sphere prims (Nones inside batch())
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if not positions.size:
+            positions = positions.reshape(0, 3)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError(f"positions must have shape (N, 3), got {positions.shape}")
+        positions = positions.tolist()
+        if len(positions) != len(paths):
+            raise ValueError(f"Got {len(paths)} paths but {len(positions)} positions")
+
+        # Build the template once
+        template_layer = Sdf.Layer.CreateAnonymous()
+        template = _define_prim_spec(template_layer, "/Sphere", "Sphere")
+        _set_attr_spec(template, "radius", _VT_DOUBLE, radius)
+        _set_translate_spec(template, (0.0, 0.0, 0.0))
         if material:
-            self._assign_material(plane, material)
-        return plane
+            _bind_material_spec(template, material)
 
-    def _assign_material(self, prim, material_path):
+        layer = self.stage.GetEditTarget().GetLayer()
+        with Sdf.ChangeBlock():
+            for path, position in zip(paths, positions):
+                path = _p(path)
+                _define_prim_spec(layer, path.GetParentPath())
+                Sdf.CopySpec(template_layer, template.path, layer, path)
+                layer.GetAttributeAtPath(path.AppendProperty("xformOp:translate")).default = Gf.Vec3d(*position)
+
+        return [self._wrap(UsdGeom.Sphere, path) for path in paths]
+
+    def add_sphere_array(self, parent_path, positions, radii=1.0, material=None):
         """
-        Internal method to assign a material to a prim.
+        Add spheres from NumPy arrays, named sphere_0..sphere_<N-1> under a parent prim
+
+        Spheres that all share one radius go through the add_spheres_bulk template path;
+        otherwise each sphere spec is authored directly, all under one change block.
 
         Args:
-            prim (Usd.Prim): Primitive to assign material to
-            material_path (str): Path to material in the stage
+            parent_path (str): USD path of the parent prim (created if missing), or "/" to
+                put the spheres at the root
+            positions (np.ndarray): (x, y, z) position per sphere, shape (N, 3)
+            radii (float or np.ndarray): One radius for all spheres, or one per sphere, shape (N,)
+            material (str, optional): Path to material to assign to every sphere
+
+        Returns:
+            list: Created UsdGeom.Sphere prims (Nones inside batch())
         """
-        material = UsdShade.Material.Get(self.stage, material_path)
-        UsdShade.MaterialBindingAPI.Apply(prim.GetPrim()).Bind(material)
-    
-    def print_stage(self):
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError(f"positions must have shape (N, 3), got {positions.shape}")
+        radii = np.asarray(radii, dtype=np.float64)
+        if radii.ndim and radii.shape != (len(positions),):
+            raise ValueError(f"radii must be a scalar or have shape ({len(positions)},), got {radii.shape}")
+
+        parent_path = _p(parent_path)
+        at_root = parent_path == Sdf.Path.absoluteRootPath
+        if not at_root and not (parent_path.IsAbsolutePath() and parent_path.IsPrimPath()):
+            raise ValueError(f"parent_path must be \"/\" or an absolute prim path, got {parent_path}")
+        paths = [parent_path.AppendChild(f"sphere_{i}") for i in range(len(positions))]
+        if not paths:
+            return []
+        if radii.ndim == 0 or (radii == radii[0]).all():
+            return self.add_spheres_bulk(paths, positions, float(radii.flat[0]), material)
+
+        layer = self.stage.GetEditTarget().GetLayer()
+        with Sdf.ChangeBlock():
+            parent_spec = _define_prim_spec(layer, parent_path)
+            for path, position, radius in zip(paths, positions.tolist(), radii.tolist()):
+                sphere_spec = _define_child_spec(parent_spec, path.name, "Sphere")
+                _set_attr_spec(sphere_spec, "radius", _VT_DOUBLE, radius)
+                _set_translate_spec(sphere_spec, position)
+                if material:
+                    _bind_material_spec(sphere_spec, _p(material))
+
+        return [self._wrap(UsdGeom.Sphere, path) for path in paths]
+
+    def add_spheres(self, specs):
         """
-        Print the USD file in ASCII format.
+        Add many sphere primitives in one batch
+
+        Args:
+            specs (iterable): (path, radius, material) per sphere; material may be None
+
+        Returns:
+            list: Created UsdGeom.Sphere prims (Nones inside batch())
+        """
+        return self._add_gprims(UsdGeom.Sphere, "Sphere", "radius", specs)
+
+    def add_cubes(self, specs):
+        """
+        Add many cube primitives in one batch
+
+        Args:
+            specs (iterable): (path, size, material) per cube; material may be None
+
+        Returns:
+            list: Created UsdGeom.Cube prims (Nones inside batch())
+        """
+        return self._add_gprims(UsdGeom.Cube, "Cube", "size", specs)
+
+    def _add_gprims(self, schema, type_name, attr_name, specs):
+        """
+        Internal method to author a batch of single-attribute gprims as prim specs.
+
+        Everything is written to the edit target layer under one change block; material
+        paths go through the interned _p cache, so each one is parsed only once.
+
+        Args:
+            schema (type): UsdGeom schema class used to wrap the results
+            type_name (str): Prim type name (e.g. "Sphere")
+            attr_name (str): Name of the double attribute to author (e.g. "radius")
+            specs (iterable): (path, value, material) per prim
+
+        Returns:
+            list: Created prims wrapped in schema (Nones inside batch())
         """
-        print(self.stage.ExportToString())
+        specs = list(specs)
+        layer = self.stage.GetEditTarget().GetLayer()
+
+        with Sdf.ChangeBlock():
+            for path, value, material in specs:
+                prim_spec = _define_prim_spec(layer, path, type_name)
+                _set_attr_spec(prim_spec, attr_name, _VT_DOUBLE, value)
+                if material:
+                    _bind_material_spec(prim_spec, _p(material))
 
-    def save(self, path=None):
+        return [self._wrap(schema, path) for path, _, _ in specs]
+
+    def print_stage(self, root_only=True):
+        """
+        Print the USD file in ASCII format.
+
+        The output is exported to a temporary file and streamed to stdout in chunks rather
+        than materialized as one Python string.
+
+        Args:
+            root_only (bool): Print only what was authored in the root layer, skipping
+                composition. Set to False to print the flattened stage, including
+                sublayers such as a referenced material library.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = pathlib.Path(tmp_dir) / "stage.usda"
+            if root_only:
+                self.stage.GetRootLayer().Export(str(tmp_path))
+            else:
+                self.stage.Export(str(tmp_path))
+            self._write_file_to_stdout(tmp_path)
+
+    def save(self, path=None, binary=False, format=None):
         """
         Save the USD stage to disk
 
+        A path without a USD extension gets ".usdc" appended, so unspecified output is
+        written as binary crate: much smaller and faster to write and reload than ASCII.
+        Pass format="usda" to get human-readable (but larger and slower) output.
+
+        Args:
+            path (str, optional): File path to save to. If None, saves existing file.
+            binary (bool): Shorthand for format="usdc".
+            format (str, optional): "usdc" or "usda". If None, the extension picks the format,
+                with ".usd" written as crate. A ".usda"/".usdc" path that contradicts the
+                format has its extension swapped, since each of those extensions only holds
+                its own encoding.
+
+        Returns:
+            str: Path of the written file
+        """
+        root_layer = self.stage.GetRootLayer()
+        if binary:
+            format = "usdc"
+
+        if path is None and format is None:
+            root_layer.Save()
+            _LOG.info("Stage saved in place.")
+            return root_layer.realPath
+
+        target, format = self._resolve_save_target(path, format)
+        return self._export_layer(root_layer, target, format)
+
+    def _resolve_save_target(self, path, format):
+        """
+        Internal method to pick the file path and format an export is written with.
+
+        Args:
+            path (str, optional): Requested file path. If None, the stage's own file.
+            format (str, optional): "usdc" or "usda", or None to go by the extension
+
+        Returns:
+            tuple: (file path, format or None)
+        """
+        real_path = self.stage.GetRootLayer().realPath
+        if not (path or real_path):
+            raise ValueError("in-memory stage: pass a path")
+        target = pathlib.Path(path or real_path)
+        if target.suffix not in _USD_EXTENSIONS:
+            target = target.with_name(f"{target.name}.{format or 'usdc'}")
+        elif format and target.suffix in (".usda", ".usdc"):
+            target = target.with_suffix(f".{format}")
+        elif format is None and target.suffix == ".usd":
+            format = "usdc"
+        return str(target), format
+
+    def save_and_dump(self, path=None):
+        """
+        Save the USD stage to disk and print it, serializing the stage only once.
+
+        ASCII (.usda) files are streamed back to stdout as written instead of exporting
+        the stage a second time; other formats fall back to print_stage().
+
         Args:
             path (str, optional): File path to save to. If None, saves existing file.
         """
-        if path:
-            self.stage.GetRootLayer().Export(path)
-            print(f"Stage exported to {path}")
+        written_path = self.save(path)
+        if pathlib.Path(written_path).suffix == ".usda":
+            self._write_file_to_stdout(written_path)
+        else:
+            self.print_stage()
+
+    @staticmethod
+    def _write_file_to_stdout(path):
+        """
+        Internal method to copy a text file to stdout in chunks.
+
+        Args:
+            path (str): File to print
+        """
+        sys.stdout.flush()
+        stdout = getattr(sys.stdout, "buffer", None)
+        if stdout is None:
+            with open(path, "r") as f:
+                shutil.copyfileobj(f, sys.stdout)
         else:
-            self.stage.GetRootLayer().Save()
-            print("Stage saved in place.")
+            with open(path, "rb") as f:
+                shutil.copyfileobj(f, stdout)
+            stdout.flush()
+
+    def save_async(self, path=None, format=None):
+        """
+        Save the USD stage to disk on a background thread
+
+        The root layer is copied first, so the stage can keep being edited while the
+        copy is written out. Call wait_saves() before exiting to make sure it finished.
+
+        The path and format follow the same rules as save().
+
+        Args:
+            path (str, optional): File path to save to. If None, writes the stage's own file.
+            format (str, optional): "usdc" or "usda". If None, the extension picks the format.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the written file path.
+        """
+        root_layer = self.stage.GetRootLayer()
+        target, format = self._resolve_save_target(path, format)
+
+        # Snapshot the layer so the export never races later edits
+        snapshot = Sdf.Layer.CreateAnonymous()
+        snapshot.TransferContent(root_layer)
+
+        if self._save_executor is None:
+            self._save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        future = self._save_executor.submit(self._export_layer, snapshot, target, format)
+        self._pending_saves.append(future)
+        return future
+
+    def wait_saves(self):
+        """
+        Block until every pending save_async call has finished, re-raising any export error.
+        """
+        pending, self._pending_saves = self._pending_saves, []
+        for future in pending:
+            future.result()
+
+    @staticmethod
+    def _export_layer(layer, path, format=None):
+        """
+        Internal method to export a layer, run by save() and on the save thread.
+
+        Args:
+            layer (Sdf.Layer): Layer to write
+            path (str): Destination file path
+            format (str, optional): File format to force, or None to go by the extension
+
+        Returns:
+            str: The written file path
+        """
+        layer.Export(path, args={"format": format} if format else {})
+        _LOG.info("Stage exported to %s", path)
+        return path
 
 
 class MaterialLibrary:
     """Class for creating and managing USD materials"""
 
-    def __init__(self, stage):
+    def __init__(self, stage, inherit_classes=False):
         """
         Initialize material library
 
         Args:
             stage (Usd.Stage): USD stage to create materials in
+            inherit_classes (bool): Share each recipe's shader network through a class prim
+                under /Materials/_Class that materials inherit from, authoring only the
+                inputs that differ from the recipe defaults. Editing a class then updates
+                every material inheriting from it.
         """
         self.stage = stage
+        self._root_path = Sdf.Path("/Materials")
+        self._inherit_classes = inherit_classes
 
-    def create_car_paint(self, name, color=(0.1, 0.2, 0.8)):
+        # Keep the /Materials spec so materials are created right under it
+        self._materials_spec = _define_prim_spec(self.stage.GetEditTarget().GetLayer(), self._root_path)
+
+        # Material paths keyed by shader inputs, so identical materials are authored once
+        self._content_cache = {}
+        # Reverse of _content_cache (material path -> key), to evict a name when it is re-authored
+        self._content_keys = {}
+
+    def create(self, kind, name, force_unique=False, **inputs):
         """
-        Create a car paint material with metallic flake appearance
+        Create a material from one of the built-in recipes
 
         Args:
+            kind (str): Recipe name: "car_paint", "glass", "plastic" or "wood"
             name (str): Name for the new material
-            color (tuple): Base color (RGB 0-1)
+            force_unique (bool): Always author a new material, even if one with the same
+                inputs already exists
+            **inputs: Shader input overrides by UsdPreviewSurface input name
+                (e.g. diffuseColor=(1, 0, 0), roughness=0.4)
 
         Returns:
-            str: Path to created material
+            str: Path to created material (an existing one when the inputs match)
         """
-        material = UsdShade.Material.Define(self.stage, f"/Materials/{name}")
+        defaults = _RECIPE_DEFAULTS.get(kind)
+        if defaults is None:
+            raise ValueError(f"Unknown material recipe {kind!r}")
+
+        values = tuple(inputs.pop(input_name, default) for input_name, default in defaults)
+        if inputs:
+            raise ValueError(f"Recipe {kind!r} has no input(s) {', '.join(inputs)}")
+        return self._create_preview_surface(kind, name, values, force_unique)
 
-        # Create shader using UsdPreviewSurface
-        shader = UsdShade.Shader.Define(self.stage, f"/Materials/{name}/Shader")
-        shader.CreateIdAttr("UsdPreviewSurface")
+    def ensure_material(self, kind, **inputs):
+        """
+        Get a material with the given recipe inputs, authoring it only if none exists yet
 
-        # Set material properties for car paint
-        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(color)
-        shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(1.0)
-        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.2)
-        shader.CreateInput("clearcoat", Sdf.ValueTypeNames.Float).Set(0.5)
-        shader.CreateInput("clearcoatRoughness", Sdf.ValueTypeNames.Float).Set(0.1)
+        Use this from procedural code that assigns materials per object: every object
+        asking for the same inputs shares one prim, named "<kind>_<n>" on first use.
 
-        # Connect shader to material output
-        material.CreateSurfaceOutput().ConnectToSource(
-            shader.ConnectableAPI(), "surface"
-        )
-        return f"/Materials/{name}"
+        Args:
+            kind (str): Recipe name: "car_paint", "glass", "plastic" or "wood"
+            **inputs: Shader input overrides by UsdPreviewSurface input name
 
-    def create_glass(self, name, color=(0.9, 0.9, 0.9), roughness=0.01, ior=1.5):
+        Returns:
+            str: Path to the material
+        """
+        return self.create(kind, None, **inputs)
+
+    def create_car_paint(self, name, color=(0.1, 0.2, 0.8), force_unique=False):
+        """
+        Create a car paint material with metallic flake appearance
+
+        Args:
+            name (str): Name for the new material
+            color (tuple): Base color (RGB 0-1)
+            force_unique (bool): Always author a new material, even if one with the same
+                inputs already exists
+
+        Returns:
+            str: Path to created material (an existing one when the inputs match)
+        """
+        return self.create("car_paint", name, force_unique, diffuseColor=color)
+
+    def create_glass(self, name, color=(0.9, 0.9, 0.9), roughness=0.01, ior=1.5, force_unique=False):
         """
         Create a glass material
 
@@ -176,23 +946,15 @@ class MaterialLibrary:
             color (tuple): Glass tint color (RGB 0-1)
             roughness (float): Surface roughness (0-1)
             ior (float): Index of refraction
+            force_unique (bool): Always author a new material, even if one with the same
+                inputs already exists
 
         Returns:
-            str: Path to created material
+            str: Path to created material (an existing one when the inputs match)
         """
-        material = UsdShade.Material.Define(self.stage, f"/Materials/{name}")
-        shader = UsdShade.Shader.Define(self.stage, f"/Materials/{name}/Shader")
-        shader.CreateIdAttr("UsdPreviewSurface")
-        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(color)
-        shader.CreateInput("opacity", Sdf.ValueTypeNames.Float).Set(0.2)
-        shader.CreateInput("ior", Sdf.ValueTypeNames.Float).Set(ior)
-        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(roughness)
-        material.CreateSurfaceOutput().ConnectToSource(
-            shader.ConnectableAPI(), "surface"
-        )
-        return f"/Materials/{name}"
+        return self.create("glass", name, force_unique, diffuseColor=color, roughness=roughness, ior=ior)
 
-    def create_plastic(self, name, color=(0.8, 0.2, 0.2), roughness=0.3):
+    def create_plastic(self, name, color=(0.8, 0.2, 0.2), roughness=0.3, force_unique=False):
         """
         Create a plastic material
 
@@ -200,23 +962,15 @@ class MaterialLibrary:
             name (str): Name for the new material
             color (tuple): Plastic color (RGB 0-1)
             roughness (float): Surface roughness (0-1)
+            force_unique (bool): Always author a new material, even if one with the same
+                inputs already exists
 
         Returns:
-            str: Path to created material
+            str: Path to created material (an existing one when the inputs match)
         """
-        material = UsdShade.Material.Define(self.stage, f"/Materials/{name}")
-        shader = UsdShade.Shader.Define(self.stage, f"/Materials/{name}/Shader")
-        shader.CreateIdAttr("UsdPreviewSurface")
-        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(color)
-        shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(roughness)
-        shader.CreateInput("specular", Sdf.ValueTypeNames.Float).Set(0.5)
-        material.CreateSurfaceOutput().ConnectToSource(
-            shader.ConnectableAPI(), "surface"
-        )
-        return f"/Materials/{name}"
+        return self.create("plastic", name, force_unique, diffuseColor=color, roughness=roughness)
 
-    def create_wood(self, name, base_color=(0.4, 0.2, 0.1), roughness=0.7):
+    def create_wood(self, name, base_color=(0.4, 0.2, 0.1), roughness=0.7, force_unique=False):
         """
         Create a wood material
 
@@ -224,21 +978,169 @@ class MaterialLibrary:
             name (str): Name for the new material
             base_color (tuple): Wood base color (RGB 0-1)
             roughness (float): Surface roughness (0-1)
+            force_unique (bool): Always author a new material, even if one with the same
+                inputs already exists
+
+        Returns:
+            str: Path to created material (an existing one when the inputs match)
+        """
+        return self.create("wood", name, force_unique, diffuseColor=base_color, roughness=roughness)
+
+    def save_as_sublayer(self, path):
+        """
+        Write the library's /Materials hierarchy to its own binary layer file
+
+        Build the library once, save it, then pull it into each generated scene with
+        SceneBuilder.reference_materials() instead of re-authoring every material.
+
+        Args:
+            path (str): File path to write. A path without a USD extension gets ".usdc".
+
+        Returns:
+            str: Path of the written layer
+        """
+        target = pathlib.Path(path)
+        if target.suffix not in _USD_EXTENSIONS:
+            target = target.with_name(f"{target.name}.usdc")
+
+        layer = Sdf.Layer.CreateAnonymous()
+        Sdf.CopySpec(self._materials_spec.layer, self._root_path, layer, self._root_path)
+        layer.Export(str(target), args={"format": "usdc"})
+        _LOG.info("Materials exported to %s", target)
+        return str(target)
+
+    def _create_preview_surface(self, kind, name, values, force_unique=False):
+        """
+        Internal method to author a UsdPreviewSurface material as raw scene description.
+
+        Copies the pre-built network for the schema under /Materials with Sdf.CopySpec,
+        then sets only the input values, under a single change notification.
+        An existing material with the same name is replaced.
+
+        Args:
+            kind (str): Recipe name, a key of _RECIPES
+            name (str): Name for the new material. If None, a free "<kind>_<n>" name is used.
+            values (tuple): Input values, in the recipe's input order
+            force_unique (bool): Skip the lookup of an existing material with the same inputs
 
         Returns:
             str: Path to created material
         """
-        material = UsdShade.Material.Define(self.stage, f"/Materials/{name}")
-        shader = UsdShade.Shader.Define(self.stage, f"/Materials/{name}/Shader")
-        shader.CreateIdAttr("UsdPreviewSurface")
-        shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(base_color)
-        shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.0)
-        shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(roughness)
-        shader.CreateInput("specular", Sdf.ValueTypeNames.Float).Set(0.5)
-        material.CreateSurfaceOutput().ConnectToSource(
-            shader.ConnectableAPI(), "surface"
-        )
-        return f"/Materials/{name}"
+        schema = _RECIPE_SCHEMAS[kind]
+
+        # Colors may come in as lists or arrays; tuples both hash and convert to Gf vectors.
+        # The cache key is rounded so float noise doesn't defeat deduplication.
+        values = tuple(tuple(map(float, value)) if hasattr(value, "__len__") else value for value in values)
+        key = (schema, tuple(_round_input(value) for value in values))
+        if self._inherit_classes:
+            # Inheriting materials follow their own recipe's class, so recipes sharing a
+            # schema (plastic, wood) must not share materials
+            key = (kind,) + key
+        if not force_unique:
+            cached = self._content_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if name is None:
+            name = self._free_name(kind)
+
+        template = _material_template(schema)
+        layer = self._materials_spec.layer
+        material_path = self._root_path.AppendChild(name)
+
+        # The name is about to hold new inputs, so it can no longer stand in for the old ones
+        stale_key = self._content_keys.pop(str(material_path), None)
+        if stale_key is not None:
+            del self._content_cache[stale_key]
+
+        with Sdf.ChangeBlock():
+            if self._inherit_classes:
+                self._author_inheriting_material(kind, name, values)
+            else:
+                Sdf.CopySpec(template, _TEMPLATE_PATH, layer, material_path)
+                shader_attrs = layer.GetPrimAtPath(material_path.AppendChild("Shader")).attributes
+                for (attr_name, _), value in zip(schema, values):
+                    shader_attrs[attr_name].default = value
+
+        material_path = str(material_path)
+        if key not in self._content_cache:
+            self._content_cache[key] = material_path
+            self._content_keys[material_path] = key
+        return material_path
+
+    def _author_inheriting_material(self, kind, name, values):
+        """
+        Internal method to author a material that inherits its network from the recipe class.
+
+        Only inputs that differ from the recipe defaults are written, as overs on the
+        inherited shader. An existing material with the same name is replaced.
+
+        Args:
+            kind (str): Recipe name, a key of _RECIPES
+            name (str): Name for the new material
+            values (tuple): Input values, in the recipe's input order
+        """
+        class_path = self._recipe_class(kind)
+
+        if name in self._materials_spec.nameChildren:
+            del self._materials_spec.nameChildren[name]
+        material_spec = _define_child_spec(self._materials_spec, name, "Material")
+        material_spec.inheritPathList.prependedItems = [class_path]
+
+        shader_spec = None
+        for (attr_name, value_type), (_, default), value in zip(_RECIPE_SCHEMAS[kind], _RECIPE_DEFAULTS[kind], values):
+            if _round_input(value) == _round_input(default):
+                continue
+            if shader_spec is None:
+                shader_spec = Sdf.PrimSpec(material_spec, "Shader", Sdf.SpecifierOver)
+            _set_attr_spec(shader_spec, attr_name, value_type, value)
+
+    def _recipe_class(self, kind):
+        """
+        Internal method to get or author the class prim holding a recipe's default network.
+
+        Args:
+            kind (str): Recipe name, a key of _RECIPES
+
+        Returns:
+            Sdf.Path: Path of the class prim
+        """
+        classes_spec = self._materials_spec.nameChildren.get("_Class")
+        if classes_spec is None:
+            classes_spec = Sdf.PrimSpec(self._materials_spec, "_Class", Sdf.SpecifierClass)
+
+        class_path = classes_spec.path.AppendChild(kind)
+        if kind not in classes_spec.nameChildren:
+            layer = self._materials_spec.layer
+            Sdf.CopySpec(_material_template(_RECIPE_SCHEMAS[kind]), _TEMPLATE_PATH, layer, class_path)
+            class_spec = layer.GetPrimAtPath(class_path)
+            class_spec.specifier = Sdf.SpecifierClass
+            shader_attrs = class_spec.nameChildren["Shader"].attributes
+            for (attr_name, _), (_, default) in zip(_RECIPE_SCHEMAS[kind], _RECIPE_DEFAULTS[kind]):
+                shader_attrs[attr_name].default = default
+        return class_path
+
+    def _free_name(self, prefix):
+        """
+        Internal method to pick a material name not yet used under /Materials.
+
+        The composed stage is checked as well as the edit layer, so names coming from a
+        sublayered library (see SceneBuilder.reference_materials) are never overridden.
+        The layer check covers materials authored inside a batch that isn't composed yet.
+
+        Args:
+            prefix (str): Name prefix
+
+        Returns:
+            str: "<prefix>_<n>" for the lowest free n
+        """
+        existing = self._materials_spec.nameChildren
+        index = 0
+        while True:
+            candidate = f"{prefix}_{index}"
+            if candidate not in existing and not self.stage.GetPrimAtPath(self._root_path.AppendChild(candidate)):
+                return candidate
+            index += 1
 
 
 class Environment:
@@ -264,9 +1166,13 @@ class Environment:
         Returns:
             UsdLux.DomeLight: Created dome light
         """
-        dome_light = UsdLux.DomeLight.Define(self.stage, "/Environment/Light")
-        dome_light.CreateTextureFileAttr(hdri_path)
-        dome_light.CreateIntensityAttr(intensity)
+        dome_light = _get_or_define(UsdLux.DomeLight, self.stage, _DOME_LIGHT_PATH)
+
+        # Coalesce the attribute edits into one change notification.
+        # Prims can't be defined inside a change block, so Define stays outside.
+        with Sdf.ChangeBlock():
+            dome_light.CreateTextureFileAttr(hdri_path)
+            dome_light.CreateIntensityAttr(intensity)
         return dome_light
 
 class Camera:
@@ -287,67 +1193,144 @@ class Camera:
 
         Args:
             path (str): USD path for the new camera.
-            position (tuple): (x, y, z) camera position.
-            target (tuple, optional): (x, y, z) target point to look at.
+            position (Gf.Vec3d, tuple or np.ndarray): (x, y, z) camera position.
+            target (Gf.Vec3d, tuple or np.ndarray, optional): (x, y, z) target point to look at.
             focal_length (float): Camera lens focal length in mm.
 
         Returns:
             UsdGeom.Camera: Created camera prim.
         """
-        camera = UsdGeom.Camera.Define(self.stage, path)
-        camera.CreateProjectionAttr().Set(UsdGeom.Tokens.perspective)
-        camera.CreateFocalLengthAttr().Set(focal_length)
-        camera.CreateClippingRangeAttr().Set((0.1, 100000))
-
-        if target:
-            self._make_camera_look_at(camera, position, target)
-        else:
-            camera.AddTranslateOp().Set(Gf.Vec3d(*position))
+        camera = _get_or_define(UsdGeom.Camera, self.stage, path)
+        with Sdf.ChangeBlock():
+            camera.CreateProjectionAttr().Set(_TOK_PERSP)
+            camera.CreateFocalLengthAttr().Set(focal_length)
+            camera.CreateClippingRangeAttr().Set((0.1, 100000))
+
+            if target is not None:
+                self._make_camera_look_at(camera, position, target)
+            else:
+                # Author the translate op on the camera's spec, skipping the op-order scan of AddTranslateOp
+                camera_spec = self.stage.GetEditTarget().GetLayer().GetPrimAtPath(camera.GetPath())
+                _set_translate_spec(camera_spec, position)
 
         return camera
 
     def  _make_camera_look_at(self, camera, camera_pos, target_pos):
         """
-        Orient camera to look at a target point using Euler angles.
+        Orient camera to look at a target point with a single matrix transform op.
 
         Args:
             camera (UsdGeom.Camera): Camera prim to orient.
-            camera_pos (tuple): Current camera position (x, y, z).
-            target_pos (tuple): Target position to look at (x, y, z).
+            camera_pos (Gf.Vec3d, tuple or np.ndarray): Current camera position (x, y, z).
+            target_pos (Gf.Vec3d, tuple or np.ndarray): Target position to look at (x, y, z).
         """
-        camera_pos = Gf.Vec3d(*camera_pos)
-        target_pos = Gf.Vec3d(*target_pos)
-
-        # Calculate direction vector and normalize
-        direction = (target_pos - camera_pos).GetNormalized()
+        camera_pos = _as_vec3d(camera_pos)
+        target_pos = _as_vec3d(target_pos)
+
+        # Build the camera basis; USD cameras look down -Z with +Y up
+        forward = camera_pos - target_pos
+        if forward.GetLength() < 1e-9:
+            # Target on the camera: no direction to face, so keep the default orientation
+            camera.MakeMatrixXform().Set(Gf.Matrix4d(1.0).SetTranslateOnly(camera_pos))
+            return
+        forward.Normalize()
+        right = Gf.Cross(_Y_AXIS, forward)
+        if right.GetLength() < 1e-9:
+            # Looking straight up or down: any horizontal right axis will do
+            right = _X_AXIS
+        else:
+            right.Normalize()
+        up = Gf.Cross(forward, right)
 
-        # Convert direction to yaw (around Y) and pitch (around X) angles
-        yaw = math.degrees(math.atan2(-direction[0], -direction[2]))
-        pitch = math.degrees(math.asin(direction[1]))
+        # Row-vector convention: rows are the camera axes, last row the position
+        matrix = Gf.Matrix4d(Gf.Matrix3d(
+            right[0], right[1], right[2],
+            up[0], up[1], up[2],
+            forward[0], forward[1], forward[2],
+        ), camera_pos)
 
-        # Apply transforms to camera
-        camera.AddTranslateOp().Set(camera_pos)
-        camera.AddRotateYOp().Set(yaw)
-        camera.AddRotateXOp().Set(pitch)
+        # Replace any existing op stack with the single matrix op
+        camera.MakeMatrixXform().Set(matrix)
 
 class RenderSettingsManager:
     """Class to manage RenderSettings, RenderProducts, and RenderVars."""
 
-    def __init__(self, stage, render_scope="/Render"):
+    def __init__(self, stage, render_scope="/Render", output_root=None):
         """
         Initialize the render settings manager.
 
         Args:
             stage (Usd.Stage): The USD stage to operate on.
             render_scope (str): Path under which to organize render-related prims.
+            output_root (str, optional): Directory that relative product output paths are
+                resolved against. Defaults to the current working directory.
         """
         self.stage = stage
         self.render_scope = render_scope
+        self._render_scope_path = Sdf.Path(render_scope)
+        self._vars_path = self._render_scope_path.AppendChild("Vars")
+
+        # Absolutize the output root once; abspath is pure string work, unlike resolve()
+        self._output_root = os.path.abspath(output_root or ".")
 
         # Create a Scope to group all rendering-related prims under /Render
-        UsdGeom.Scope.Define(stage, render_scope)
+        _get_or_define(UsdGeom.Scope, stage, self._render_scope_path)
 
-    def create_basic_render_settings(self, settings_name, camera_path, resolution=(512, 512), products=[]):
+    def configure(self, settings_name, camera_path, resolution=(512, 512), products_spec=(), vars_spec=()):
+        """
+        Author RenderVars, RenderProducts and the RenderSettings prim in one pass.
+
+        Everything is written as raw prim specs inside a single change block, so the
+        whole render setup costs one change notification instead of one per call.
+
+        Args:
+            settings_name (str): Name of the RenderSettings prim.
+            camera_path (str): Path to the Camera prim used by the settings and every product.
+            resolution (tuple): Output resolution (width, height).
+            products_spec (list): (name, output_path, var_names) for each RenderProduct,
+                where var_names are RenderVar names in channel order.
+            vars_spec (list): One dict per RenderVar with "name" and "source_name" keys,
+                plus optional "data_type" (defaults to "float") and "source_type".
+
+        Returns:
+            str: Path to the created RenderSettings prim.
+        """
+        layer = self.stage.GetEditTarget().GetLayer()
+        camera_targets = [camera_path]
+        product_paths = []
+
+        with Sdf.ChangeBlock():
+            for var in vars_spec:
+                var_spec = _define_prim_spec(layer, self._vars_path.AppendChild(var["name"]), "RenderVar")
+                _set_attr_spec(var_spec, "sourceName", _VT_STRING, var["source_name"], Sdf.VariabilityUniform)
+                _set_attr_spec(var_spec, "dataType", _VT_TOKEN, var.get("data_type", "float"),
+                               Sdf.VariabilityUniform)
+                if var.get("source_type"):
+                    _set_attr_spec(var_spec, "sourceType", _VT_TOKEN, var["source_type"], Sdf.VariabilityUniform)
+
+            for name, output_path, var_names in products_spec:
+                product_spec = _define_prim_spec(layer, self._render_scope_path.AppendChild(name), "RenderProduct")
+                _set_attr_spec(product_spec, "productName", _VT_TOKEN, self._product_name(output_path))
+                _set_rel_spec(product_spec, "camera", camera_targets)
+                if var_names:
+                    _set_rel_spec(product_spec, "orderedVars", [self._vars_path.AppendChild(v) for v in var_names])
+                product_paths.append(product_spec.path)
+
+            settings_spec = _define_prim_spec(layer, self._render_scope_path.AppendChild(settings_name),
+                                              "RenderSettings")
+            _set_attr_spec(settings_spec, "resolution", _VT_INT2, Gf.Vec2i(*resolution), Sdf.VariabilityUniform)
+            _set_rel_spec(settings_spec, "camera", camera_targets)
+
+            # Write the products relationship once, with every product
+            if product_paths:
+                _set_rel_spec(settings_spec, "products", product_paths)
+
+            settings_path = str(settings_spec.path)
+            self.stage.SetMetadata("renderSettingsPrimPath", settings_path)
+
+        return settings_path
+
+    def create_basic_render_settings(self, settings_name, camera_path, resolution=(512, 512), products=None):
         """
         Create a RenderSettings prim and link it to products and a camera.
 
@@ -355,29 +1338,31 @@ class RenderSettingsManager:
             settings_name (str): Name of the RenderSettings prim.
             camera_path (str): Path to the Camera prim to use.
             resolution (tuple): Output resolution (width, height).
-            products (list): List of paths to RenderProduct prims.
+            products (list, optional): List of paths to RenderProduct prims.
 
         Returns:
             str: Path to the created RenderSettings prim.
         """
-        settings_path = f"{self.render_scope}/{settings_name}"
+        settings_path = self._render_scope_path.AppendChild(settings_name)
 
         # Define the RenderSettings prim at the desired path
-        settings = UsdRender.Settings.Define(self.stage, settings_path)
+        settings = _get_or_define(UsdRender.Settings, self.stage, settings_path)
 
-        self.stage.SetMetadata("renderSettingsPrimPath", settings_path)
+        # Author metadata, attributes and relationships under one change notification
+        with Sdf.ChangeBlock():
+            self.stage.SetMetadata("renderSettingsPrimPath", str(settings_path))
 
-        # Set the image resolution
-        settings.CreateResolutionAttr().Set(Gf.Vec2i(*resolution))
+            # Set the image resolution
+            settings.CreateResolutionAttr().Set(Gf.Vec2i(*resolution))
 
-        # Link the camera
-        settings.CreateCameraRel().SetTargets([Sdf.Path(camera_path)])
+            # Link the camera
+            settings.CreateCameraRel().SetTargets([_p(camera_path)])
 
-        # Optionally link to output products (images, depth maps, etc.)
-        if products:
-            settings.CreateProductsRel().SetTargets([Sdf.Path(p) for p in products])
+            # Optionally link to output products (images, depth maps, etc.)
+            if products:
+                settings.CreateProductsRel().SetTargets([_p(product) for product in products])
 
-        return settings_path
+        return str(settings_path)
 
     def create_render_product(self, name, camera_path, output_path, ordered_vars=None):
         """
@@ -392,21 +1377,36 @@ class RenderSettingsManager:
         Returns:
             str: Path to the created RenderProduct prim.
         """
-        product_path = f"{self.render_scope}/{name}"
+        product_path = self._render_scope_path.AppendChild(name)
         # Define the RenderProduct prim
-        product = UsdRender.Product.Define(self.stage, product_path)
+        product = _get_or_define(UsdRender.Product, self.stage, product_path)
+
+        with Sdf.ChangeBlock():
+            # Set the output filename (convert to POSIX style for USD compatibility)
+            # product.CreateProductNameAttr().Set(str(pathlib.Path(output_path).as_posix()))
+            product.CreateProductNameAttr().Set(self._product_name(output_path))
 
-        # Set the output filename (convert to POSIX style for USD compatibility)
-        # product.CreateProductNameAttr().Set(str(pathlib.Path(output_path).as_posix()))
-        product.CreateProductNameAttr().Set(str(pathlib.Path(output_path).resolve().as_posix()))
+            # Attach the product to a camera
+            product.CreateCameraRel().SetTargets([_p(camera_path)])
 
-        # Attach the product to a camera
-        product.CreateCameraRel().SetTargets([Sdf.Path(camera_path)])
+            # Link to the ordered list of render variables (AOVs, LPEs, etc.)
+            if ordered_vars:
+                product.CreateOrderedVarsRel().SetTargets([_p(var) for var in ordered_vars])
+        return str(product_path)
 
-        # Link to the ordered list of render variables (AOVs, LPEs, etc.)
-        if ordered_vars:
-            product.CreateOrderedVarsRel().SetTargets([Sdf.Path(v) for v in ordered_vars])
-        return product_path
+    def _product_name(self, output_path):
+        """
+        Internal method to turn an output path into an absolute, normalized POSIX path.
+
+        Only string operations are used, so no filesystem calls are made per product.
+
+        Args:
+            output_path (str): File path for the rendered output, relative to the output root
+
+        Returns:
+            str: Absolute output path with forward slashes
+        """
+        return os.path.normpath(os.path.join(self._output_root, output_path)).replace(os.sep, "/")
 
     def create_render_var(self, var_name, source_name, data_type="float", source_type=None):
         """
@@ -421,10 +1421,10 @@ class RenderSettingsManager:
         Returns:
             str: Path to the created RenderVar prim.
         """
-        var_path = f"{self.render_scope}/Vars/{var_name}"
+        var_path = self._vars_path.AppendChild(var_name)
 
         # Define the RenderVar prim at the path
-        var = UsdRender.Var.Define(self.stage, var_path)
+        var = _get_or_define(UsdRender.Var, self.stage, var_path)
 
         # Tell the renderer what value to output (e.g., "Ci" for color, "depth" for z-buffer)
         var.CreateSourceNameAttr().Set(source_name)
@@ -436,4 +1436,4 @@ class RenderSettingsManager:
         if source_type:
             var.CreateSourceTypeAttr().Set(source_type)
 
-        return var_path
\ No newline at end of file
+        return str(var_path)
\ No newline at end of file